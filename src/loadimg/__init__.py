@@ -1,3 +1,3 @@
-from .utils import load_img  # noqa: F401
+from .utils import load_img, load_imgs  # noqa: F401
 
 __version__ = "0.3.6"
@@ -0,0 +1,51 @@
+"""Command line interface for loadimg.
+
+Usage: python -m loadimg <input> [--output-type ansi] [--fit WIDTH [HEIGHT]]
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .utils import _convert, load, resize_image
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="loadimg", description="Load an image from anywhere."
+    )
+    parser.add_argument("input", help="a file path, URL, or base64 string")
+    parser.add_argument(
+        "--output-type",
+        choices=["pil", "numpy", "str", "base64", "ascii", "ansi"],
+        default="ansi",
+        help="the output format to print (default: ansi)",
+    )
+    parser.add_argument(
+        "--input-type",
+        choices=["auto", "base64", "file", "url", "numpy", "pil"],
+        default="auto",
+        help="the type of the input (default: auto)",
+    )
+    parser.add_argument(
+        "--fit",
+        nargs="+",
+        type=int,
+        metavar=("WIDTH", "HEIGHT"),
+        default=None,
+        help="resize to WIDTH [HEIGHT] before converting",
+    )
+    args = parser.parse_args(argv)
+
+    # Load once and convert the already-loaded image directly instead of
+    # re-entering load_img (and its input-type detection) a second time
+    # after resizing.
+    img, original_name = load(args.input, args.input_type)
+    if args.fit:
+        img = resize_image(img, *args.fit[:2])
+    print(_convert(img, args.output_type, original_name))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
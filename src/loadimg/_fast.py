@@ -0,0 +1,79 @@
+"""Optional numba-compiled kernels for the ASCII/ANSI renderers.
+
+Importing this module never fails: when numba is not installed the kernels
+are set to ``None`` and callers fall back to the NumPy implementations.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def ascii_kernel(arr, lut, out):
+        """Writes one LUT character per pixel plus a trailing newline per row.
+
+        ``arr`` is the HxW grayscale uint8 array, ``lut`` a fused 256-entry
+        pixel-value -> character table, and ``out`` a preallocated Hx(W+1)
+        uint8 buffer. Rows are independent, so they render in parallel.
+        """
+        height, width = arr.shape
+        for y in prange(height):
+            for x in range(width):
+                out[y, x] = lut[arr[y, x]]
+            out[y, width] = 10  # "\n"
+
+    @njit(cache=True, boundscheck=False)
+    def ansi_kernel(arr, out):
+        """Emits ``\\x1b[48;2;R;G;Bm `` per pixel into ``out``, returning the
+        number of bytes written.
+
+        ``arr`` is the HxWx3 uint8 array and ``out`` a preallocated uint8
+        buffer of at least ``H * (W * 20 + 5)`` bytes. Each row is terminated
+        with ``\\x1b[0m\\n``.
+        """
+        height, width, _ = arr.shape
+        pos = 0
+        for y in range(height):
+            for x in range(width):
+                out[pos] = 27  # "\x1b"
+                out[pos + 1] = 91  # "["
+                out[pos + 2] = 52  # "4"
+                out[pos + 3] = 56  # "8"
+                out[pos + 4] = 59  # ";"
+                out[pos + 5] = 50  # "2"
+                out[pos + 6] = 59  # ";"
+                pos += 7
+                for c in range(3):
+                    value = arr[y, x, c]
+                    if value >= 100:
+                        out[pos] = 48 + value // 100
+                        out[pos + 1] = 48 + (value // 10) % 10
+                        out[pos + 2] = 48 + value % 10
+                        pos += 3
+                    elif value >= 10:
+                        out[pos] = 48 + value // 10
+                        out[pos + 1] = 48 + value % 10
+                        pos += 2
+                    else:
+                        out[pos] = 48 + value
+                        pos += 1
+                    if c < 2:
+                        out[pos] = 59  # ";"
+                        pos += 1
+                out[pos] = 109  # "m"
+                out[pos + 1] = 32  # " "
+                pos += 2
+            out[pos] = 27
+            out[pos + 1] = 91
+            out[pos + 2] = 48  # "0"
+            out[pos + 3] = 109
+            out[pos + 4] = 10
+            pos += 5
+        return pos
+
+else:
+    ascii_kernel = None
+    ansi_kernel = None